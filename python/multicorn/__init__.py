@@ -79,6 +79,9 @@ class Qual(object):
 
     """
 
+    # One instance is built per qual for every scan: avoid a per-instance dict.
+    __slots__ = ('field_name', 'operator', 'value')
+
     def __init__(self, field_name, operator, value):
         """Constructs a qual object.
 
@@ -4,6 +4,31 @@ import sys
 from multicorn.compat import unicode_
 
 
+def to_unicode(obj):
+    """Return a unicode representation of any object.
+
+    Text and bytes are dispatched on their type, so that only arbitrary
+    objects go through str() and its possible encoding errors.
+    """
+    if isinstance(obj, unicode_):
+        return obj
+    if isinstance(obj, bytes):
+        return obj.decode('utf8')
+    try:
+        text = str(obj)
+        if not isinstance(text, unicode_):
+            # Python 2: str() returns bytes
+            text = text.decode('utf8')
+        return text
+    except (UnicodeEncodeError, UnicodeDecodeError):
+        pass
+    try:
+        # Python 2: __unicode__ may work where __str__ cannot encode
+        return unicode_(obj)
+    except (UnicodeEncodeError, UnicodeDecodeError):
+        return unicode_("<NA>")
+
+
 class MyClass(object):
 
     def __init__(self, num, rand):
@@ -18,18 +43,7 @@ class GCForeignDataWrapper(ForeignDataWrapper):
         result = []
         for obj in gc.get_objects():
             tobj = type(obj)
-            if isinstance(obj, bytes):
-                obj = obj.decode('utf8')
-            elif isinstance(obj, unicode_):
-                pass
-            else:
-                try:
-                    obj = bytes(obj).decode('utf8')
-                except (UnicodeEncodeError, UnicodeDecodeError):
-                    try:
-                        obj = unicode_(obj)
-                    except (UnicodeEncodeError, UnicodeDecodeError):
-                        obj = unicode_("<NA>")
+            obj = to_unicode(obj)
             result.append({'object': obj,
                            'type': unicode_(tobj),
                            'id': unicode_(id(obj)),
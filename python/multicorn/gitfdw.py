@@ -24,9 +24,15 @@ class GitFdw(ForeignDataWrapper):
         self.encoding = fdw_options.get("encoding", "utf-8")
 
     def execute(self, quals, columns):
-        def enc(unicode_str):
-            """Encode the string in the self given encoding."""
-            return unicode_str.encode(self.encoding)
+        def enc(value):
+            """Encode the string in the self given encoding.
+
+            Already encoded strings are returned as is: on Python 2,
+            calling encode on them would first decode them as ascii.
+            """
+            if isinstance(value, bytes):
+                return value
+            return value.encode(self.encoding)
         for log in brigit.Git(self.path).pretty_log():
             yield {
                 'author_name': enc(log["author"]['name']),
@@ -87,6 +87,9 @@ import ldap3
 from multicorn.utils import log_to_postgres, ERROR
 from multicorn.compat import unicode_
 
+# Evaluated once: it is checked for every attribute of every returned entry.
+LDAP3_V2 = ldap3.version.__version__ > '2.0.0'
+
 
 SPECIAL_CHARS = {
     ord('*'): '\\2a',
@@ -123,16 +126,16 @@ class LdapFdw(ForeignDataWrapper):
             ldap3.Server(self.ldapuri),
             user=fdw_options.get("binddn", None),
             password=fdw_options.get("bindpwd", None),
-            client_strategy=ldap3.RESTARTABLE if ldap3.version.__version__ > '2.0.0' else ldap3.STRATEGY_SYNC_RESTARTABLE)
+            client_strategy=ldap3.RESTARTABLE if LDAP3_V2 else ldap3.STRATEGY_SYNC_RESTARTABLE)
         self.path = fdw_options["path"]
         self.scope = self.parse_scope(fdw_options.get("scope", None))
         self.object_class = fdw_options["objectclass"]
         self.field_list = fdw_columns
         self.field_definitions = dict(
             (name.lower(), field) for name, field in self.field_list.items())
-        self.array_columns = [
+        self.array_columns = set(
             col.column_name for name, col in self.field_definitions.items()
-            if col.type_name.endswith('[]')]
+            if col.type_name.endswith('[]'))
 
     def execute(self, quals, columns):
         request = unicode_("(objectClass=%s)") % self.object_class
@@ -157,24 +160,20 @@ class LdapFdw(ForeignDataWrapper):
             # Case insensitive lookup for the attributes
             litem = dict()
             for key, value in entry["attributes"].items():
-                if key.lower() in self.field_definitions:
-                    pgcolname = self.field_definitions[key.lower()].column_name
-                    if ldap3.version.__version__ > '2.0.0':
-                        value = value
-                    else:
-                        if pgcolname in self.array_columns:
-                            value = value
-                        else:
-                            value = value[0]
+                field = self.field_definitions.get(key.lower())
+                if field is not None:
+                    pgcolname = field.column_name
+                    if not LDAP3_V2 and pgcolname not in self.array_columns:
+                        value = value[0]
                     litem[pgcolname] = value
             yield litem
 
     def parse_scope(self, scope=None):
         if scope in (None, "", "one"):
-            return ldap3.LEVEL if ldap3.version.__version__ > '2.0.0' else ldap3.SEARCH_SCOPE_SINGLE_LEVEL
+            return ldap3.LEVEL if LDAP3_V2 else ldap3.SEARCH_SCOPE_SINGLE_LEVEL
         elif scope == "sub":
-            return ldap3.SUBTREE if ldap3.version.__version__ > '2.0.0' else ldap3.SEARCH_SCOPE_WHOLE_SUBTREE
+            return ldap3.SUBTREE if LDAP3_V2 else ldap3.SEARCH_SCOPE_WHOLE_SUBTREE
         elif scope == "base":
-            return ldap3.BASE if ldap3.version.__version__ > '2.0.0' else ldap3.SEARCH_SCOPE_BASE_OBJECT
+            return ldap3.BASE if LDAP3_V2 else ldap3.SEARCH_SCOPE_BASE_OBJECT
         else:
             log_to_postgres("Invalid scope specified: %s" % scope, ERROR)
@@ -80,6 +80,7 @@ definition:
 """
 
 from . import ForeignDataWrapper
+from contextlib import closing
 from datetime import datetime, timedelta
 from lxml import etree
 try:
@@ -138,9 +139,9 @@ class RssFdw(ForeignDataWrapper):
             log_to_postgres("You MUST set an url when creating the table!",
                             ERROR)
         self.columns = columns
-        self.default_namespace_prefix = options.pop(
+        self.default_namespace_prefix = options.get(
             'default_namespace_prefix', None)
-        self.item_root = options.pop('item_root', 'item')
+        self.item_root = options.get('item_root', 'item')
 
     def get_namespaces(self, xml):
         ns = dict(xml.nsmap)
@@ -152,9 +153,9 @@ class RssFdw(ForeignDataWrapper):
         """Internal method used for parsing item xml element from the
         columns definition."""
         item = {}
+        namespaces = self.get_namespaces(xml_elem)
         for prop, column in self.columns.items():
-            value = xml_elem.xpath(
-                prop, namespaces=self.get_namespaces(xml_elem))
+            value = xml_elem.xpath(prop, namespaces=namespaces)
             if value:
                 if column.type_name.startswith('json'):
                     item[prop] = json.dumps([
@@ -175,7 +176,8 @@ class RssFdw(ForeignDataWrapper):
                 if (datetime.now() - date) < self.cache_duration:
                     return values
         try:
-            xml = etree.fromstring(urlopen(self.url).read())
+            with closing(urlopen(self.url)) as response:
+                xml = etree.fromstring(response.read())
             items = [self.make_item_from_xml(elem)
                      for elem in xml.xpath(
                          '//%s' % self.item_root,
@@ -250,6 +250,12 @@ CONVERSION_MAP = {
     mssql_dialect.TEXT: length_stripper(TEXT)
 }
 
+# Patterns used by SqlAlchemyFdw._get_column_type to parse type names
+TYPMOD_RE = re.compile(r'\(.*\)')
+CHARLEN_RE = re.compile(r'\(([\d,]+)\)')
+TYPE_ARGS_RE = re.compile(r'\((.*)\)')
+ARGS_SEPARATOR_RE = re.compile(r'\s*,\s*')
+
 SORT_SUPPORT = {
     'mssql': {'default': 'lower', 'support': False},
     'postgresql': {'default': 'higher', 'support': True},
@@ -427,18 +433,18 @@ class SqlAlchemyFdw(ForeignDataWrapper):
         """Blatant ripoff from PG_Dialect.get_column_info"""
         # strip (*) from character varying(5), timestamp(5)
         # with time zone, geometry(POLYGON), etc.
-        attype = re.sub(r'\(.*\)', '', format_type)
+        attype = TYPMOD_RE.sub('', format_type)
 
         # strip '[]' from integer[], etc.
-        attype = re.sub(r'\[\]', '', attype)
+        attype = attype.replace('[]', '')
 
         is_array = format_type.endswith('[]')
-        charlen = re.search('\(([\d,]+)\)', format_type)
+        charlen = CHARLEN_RE.search(format_type)
         if charlen:
             charlen = charlen.group(1)
-        args = re.search('\((.*)\)', format_type)
+        args = TYPE_ARGS_RE.search(format_type)
         if args and args.group(1):
-            args = tuple(re.split('\s*,\s*', args.group(1)))
+            args = tuple(ARGS_SEPARATOR_RE.split(args.group(1)))
         else:
             args = ()
         kwargs = {}